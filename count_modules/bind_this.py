@@ -7,12 +7,10 @@ Functions:
 """
 # Copyright (C) 2021 C. Echt under GNU General Public License'
 
-import sys
 from tkinter import constants, Menu
 
 from count_modules import files
-
-MY_OS = sys.platform[:3]
+from count_modules.config_constants import MY_OS
 
 
 def click(click_type, click_widget) -> None:
@@ -63,7 +61,7 @@ def click(click_type, click_widget) -> None:
         popup.tk_popup(event.x_root + 10, event.y_root + 15)
 
     if click_type == 'right':
-        if MY_OS in 'lin, win':
+        if MY_OS in ('lin', 'win'):
             click_widget.bind('<Button-3>', popup_menu)
         elif MY_OS == 'dar':
             click_widget.bind('<Button-2>', popup_menu)
@@ -92,7 +90,7 @@ def keybind(func: str,
                      'append'.
     :param text: Text to append to *filepath*; use with *func* 'append'.
     """
-    if MY_OS in 'lin, win':
+    if MY_OS in ('lin', 'win'):
         cmd_key = 'Control'
     else:  # MY_OS == 'dar':
         cmd_key = 'Command'
@@ -26,10 +26,9 @@ from pathlib import Path
 from subprocess import Popen, PIPE, STDOUT
 from tkinter import messagebox
 
-CFGFILE = Path('countCFG.txt').resolve()
+from count_modules.config_constants import MY_OS
 
-# Only win, lin, and dar values are accommodated here.
-MY_OS = sys.platform[:3]
+CFGFILE = Path('countCFG.txt').resolve()
 
 # Tuples that may be used in various functions:
 TASK_TAGS = ('name', 'WU name', 'project URL', 'received',
@@ -65,12 +64,12 @@ def set_boincpath() -> str:
     # Need to first check for custom path in the configuration file.
     # Do split to remove the "custom_path" tag, then join to restore the
     #   path with any spaces it might have.
-    if Path.is_file(CFGFILE):
-        cfg_text = Path(CFGFILE).read_text()
+    if CFGFILE.is_file():
+        cfg_text = CFGFILE.read_text()
         for line in cfg_text.splitlines():
             if '#' not in line and 'custom_path' in line:
                 custom_path = " ".join(line.split()[1:])
-                if not Path.is_file(Path(custom_path)):
+                if not Path(custom_path).is_file():
                     sys.exit(f'The custom path: {custom_path}\n'
                              'is not a recognized file or path.\n')
                 return f'"{custom_path}"'
@@ -83,7 +82,7 @@ def set_boincpath() -> str:
     # Note: On macOS, the Terminal command line would be entered as:
     # /Users/youtheuser/Library/Application\ Support/BOINC/boinccmd
 
-    if MY_OS not in default_path or not Path.is_file(default_path[MY_OS]):
+    if MY_OS not in default_path or not default_path[MY_OS].is_file():
         sys.exit(
             f'Error: The application boinccmd is not in its expected default path: '
             f'{default_path.get(MY_OS, "Unknown OS")}\n'
@@ -174,8 +173,9 @@ def check_boinc_tk(mainloop) -> None:
             detail='BOINC commands cannot be executed.\n'
                    'Is the BOINC client running?\nExiting now...')
         mainloop.update_idletasks()
-        mainloop.after(100)
-        mainloop.destroy()
+        # Schedule the destroy instead of blocking in after(100) with no
+        #   callback, which sleeps and stalls the Tk event loop.
+        mainloop.after(100, mainloop.destroy)
         sys.exit(0)
 
 
@@ -4,6 +4,7 @@ Basic tkinter file handling functions.
 Functions:
     valid_path_to - Get absolute path to files and directories.
     append_txt - Append text_obj to the destination file.
+    toast - Briefly show a self-closing, non-modal confirmation.
     save_as - Copy source file to destination of choice.
     erase - Delete file content and the displayed window text_obj.
     update - Replace text_obj in window with current file content.
@@ -11,11 +12,12 @@ Functions:
 # Copyright (C) 2021 C. Echt under GNU General Public License'
 
 # Standard library import modules
+import os
 import sys
-from datetime import datetime
 from pathlib import Path
 from platform import node
 from shutil import copy2
+from time import strftime
 
 # Third party imports: tkinter may not be included with some Python distributions.
 try:
@@ -29,6 +31,12 @@ except (ImportError, ModuleNotFoundError) as error:
              f'See also: https://tkdocs.com/tutorial/install.html \n'
              f'Error msg: {error}')
 
+# Local program imports:
+from count_modules.config_constants import MY_OS
+
+# The one toast() window that may be showing; reused by repeated calls.
+_toast_win = None
+
 
 def valid_path_to(relative_path: str) -> Path:
     """
@@ -63,15 +71,19 @@ def append_txt(dest: Path, savetxt: str, showmsg=True, parent=None) -> None:
     """
 
     try:
-        with open(dest, 'a', encoding='utf-8') as saved:
-            saved.write(savetxt)
-            if showmsg:
-                messagebox.showinfo(message='Results saved (appended) to:',
-                                    detail=dest, parent=parent)
-            # Need to remove focus from calling Button so can execute any
-            #   immediately following rt-click commands in parent.
-            if parent:
-                parent.focus_set()
+        # Write the encoded text in binary mode to skip the text wrapper;
+        #   keep the platform line endings that text mode would have given.
+        if os.linesep != '\n':
+            savetxt = savetxt.replace('\n', os.linesep)
+        with open(dest, 'ab') as saved:
+            saved.write(savetxt.encode('utf-8'))
+        if showmsg:
+            toast(message='Results saved (appended) to:',
+                  detail=dest, parent=parent)
+        # Need to remove focus from calling Button so can execute any
+        #   immediately following rt-click commands in parent.
+        if parent:
+            parent.focus_set()
     except PermissionError:
         perr = (f'On {node()}, {dest}\n could not be opened because\n'
                 'of insufficient permissions.')
@@ -95,6 +107,35 @@ def append_txt(dest: Path, savetxt: str, showmsg=True, parent=None) -> None:
         print(oserr)
 
 
+def toast(message: str, detail, parent=None) -> None:
+    """
+    Show a confirmation in a small window that closes itself, without
+    blocking the event loop as a modal messagebox does. Calls made
+    while it is showing reuse that window and restart its timer.
+
+    :param message: The confirmation text.
+    :param detail: Additional text, e.g., a file path, shown below it.
+    :param parent: Toplevel object over which the toast appears.
+    """
+    global _toast_win
+
+    if _toast_win is not None and _toast_win.winfo_exists():
+        _toast_win.after_cancel(_toast_win.close_id)
+    else:
+        _toast_win = tk.Toplevel(parent)
+        _toast_win.title('Done')
+        _toast_win.resizable(False, False)
+        _toast_win.label = tk.Label(_toast_win, justify='left',
+                                    padx=15, pady=10)
+        _toast_win.label.pack()
+        if parent:
+            _toast_win.geometry(f'+{parent.winfo_rootx() + 30}'
+                                f'+{parent.winfo_rooty() + 30}')
+
+    _toast_win.label.config(text=f'{message}\n{detail}')
+    _toast_win.close_id = _toast_win.after(2500, _toast_win.destroy)
+
+
 def save_as(source: Path, parent=None) -> None:
     """
     Copy source file to a destination of user's choice;
@@ -105,7 +146,7 @@ def save_as(source: Path, parent=None) -> None:
                    defaults to app (master) window.
     """
 
-    if not Path.exists(source):
+    if not source.exists():
         fnf_detail = (f'On {node()}, cannot back up:\n'
                       f'{source}\nHas it been moved or renamed?')
         messagebox.showerror(title='FILE NOT FOUND', detail=fnf_detail,
@@ -113,7 +154,7 @@ def save_as(source: Path, parent=None) -> None:
         return
 
     # Offer to use a timestamp for each save_as file saved.
-    _ts = datetime.now().strftime("%d%m%Y_%H%M")
+    _ts = strftime("%d%m%Y_%H%M")
     backupname = f'{source.stem}_{_ts}_{source.suffix}'
     backupfile = filedialog.asksaveasfilename(
         initialfile=backupname, parent=parent,
@@ -151,7 +192,7 @@ def erase(text_obj: tk.Text, file: Path, parent=None) -> None:
                    as parent window.
     """
 
-    if not Path.exists(file):
+    if not file.exists():
         info = (f'On {node()}, could not erase contents of\n'
                 f'{file}\nbecause file is missing.\n'
                 'Was it deleted, moved or renamed?')
@@ -163,7 +204,7 @@ def erase(text_obj: tk.Text, file: Path, parent=None) -> None:
             parent.focus_set()
         return
 
-    if sys.platform[:3] == 'dar':
+    if MY_OS == 'dar':
         msgdetail = (f"'Enter/Return' will also delete "
                      f"content of file {file}.")
     else:
@@ -174,9 +215,10 @@ def erase(text_obj: tk.Text, file: Path, parent=None) -> None:
                                   detail=msgdetail, parent=parent)
     if okay:
         try:
-            with open(file, 'w') as _f:
-                _f.close()
+            os.truncate(file, 0)
             text_obj.delete('1.0', tk.END)
+            # Need the next update() to do a full reload.
+            text_obj.file_offset = 0
             if parent:
                 parent.focus_set()
         except PermissionError:
@@ -197,17 +239,39 @@ def update(text_obj: tk.Text, file: Path, parent=None) -> None:
            usually a Toplevel(). Defaults to app window.
     """
 
-    if not Path.exists(file):
+    # Let the open() report a missing file, rather than stat it first.
+    try:
+        _f = open(file, encoding='utf-8')
+    except FileNotFoundError:
         msg = (f'On {node()}, cannot update file:\n{file}\n'
                'Was file deleted, moved or renamed?')
         messagebox.showerror(title='FILE NOT FOUND',
                              detail=msg, parent=parent)
         return
 
-    text_obj.delete(tk.INSERT, tk.END)
-    text_obj.insert(tk.INSERT, Path(file).read_text())
+    with _f:
+        # Logs only grow between updates, so when the file is no smaller and
+        #   no older than at the last update, just append the new tail.
+        #   Otherwise, as after an erase or for a first update, reload it all.
+        #   The read offset and mtime are kept on the text_obj itself.
+        stat = os.fstat(_f.fileno())
+        offset = getattr(text_obj, 'file_offset', 0)
+        if not (0 < offset <= stat.st_size
+                and stat.st_mtime_ns >= getattr(text_obj, 'file_mtime', 0)):
+            text_obj.delete('1.0', tk.END)
+            offset = 0
+
+        # Insert large files in chunks to avoid holding the whole file as one
+        #   string while Tk copies it, and let the window redraw as it loads.
+        _f.seek(offset)
+        for num, chunk in enumerate(iter(lambda: _f.read(65536), ''), start=1):
+            text_obj.insert(tk.END, chunk)
+            if num % 16 == 0:
+                text_obj.update_idletasks()
+        text_obj.file_offset = _f.tell()
+    text_obj.file_mtime = stat.st_mtime_ns
+
     text_obj.see(tk.END)
-    text_obj.pack(fill=tk.BOTH, side=tk.LEFT, expand=True)
     # Need to remove focus from calling Button so can execute any
     #   immediately following rt-click commands in parent. Use as a
     #   precaution in case Button is not configured takefocus=False.
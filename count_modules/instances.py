@@ -7,28 +7,37 @@ Class OneWinstance: Windows only; uses CreateMutex.
 Functions:
 program_name: sets the program name depending on app
 exit_popup: Create a toplevel window to announce program exit.
-lock_or_exit: Linux and macOS only; uses fcntl.lockf()
+lock_or_exit: Linux and macOS only; uses fcntl.flock()
 sentinel_or_exit: Cross-platform; uses Temporary sentinel files.
 """
 # Copyright (C) 2021 C. Echt under GNU General Public License'
 
+import atexit
+import getpass
+import os
 import sys
-import tkinter as tk
+from functools import lru_cache
 from pathlib import Path
 from tempfile import gettempdir, NamedTemporaryFile
 from time import sleep
 from typing import TextIO
 
-from count_modules import bind_this
-
-if sys.platform[:3] == 'win':
+if sys.platform.startswith('win'):
+    import msvcrt
     from win32event import CreateMutex
     from win32api import CloseHandle, GetLastError
     from winerror import ERROR_ALREADY_EXISTS
 else:
     import fcntl
 
+# The system temp folder, where sentinel_or_exit() puts its sentinel files.
+_TEMP_DIR = gettempdir()
+
+# Need to remove problematic path characters from sentinel file names.
+_TRANS_TABLE = str.maketrans('\\/: ', '____')
+
 
+@lru_cache(maxsize=1)
 def program_name() -> str:
     """
     Returns the script name or, if called from a PyInstaller stand-alone,
@@ -48,15 +57,29 @@ class OneWinstance:
         exit_msg = 'The program is already running. Exiting...'
         winstance = instances.OneWinstance()
         winstance.exit_twinstance(exit_msg)
+    Or, to close the mutex handle when leaving the block:
+        with instances.OneWinstance() as winstance:
+            winstance.exit_twinstance(exit_msg)
+            ...
     """
     # Inspired by https://stackoverflow.com/questions/380870/
     #   make-sure-only-a-single-instance-of-a-program-is-running
     def __init__(self):
         # The mutex name needs to be static, unique suffix is meaningless.
-        self.mutexname = f'{program_name()}_ZJokEOtOTRQvOmnOylGO'
+        #   The Local\ namespace limits the mutex to the user's session.
+        self.mutexname = f'Local\\{program_name()}_ZJokEOtOTRQvOmnOylGO'
         self.mutex = CreateMutex(None, False, self.mutexname)
         self.lasterror = GetLastError()
 
+        # A twin instance has no use for its handle to the first instance's
+        #   mutex, so release it now rather than hold it until exit.
+        #   Otherwise, need a deterministic close at exit, which a __del__
+        #   finalizer does not guarantee.
+        if self.lasterror == ERROR_ALREADY_EXISTS:
+            self.close()
+        else:
+            atexit.register(self.close)
+
     def already_running(self) -> bool:
         """
         No errors (ERROR_ALREADY_EXISTS == 0) when a mutex
@@ -67,22 +90,42 @@ class OneWinstance:
         """
         return self.lasterror == ERROR_ALREADY_EXISTS
 
-    # Need to leave console open long enough to read the exit message.
     def exit_twinstance(self, message: str):
         """
         Exit the program when another instance is already running.
-        Delay exit after displaying *message*.
+        When run from a console, wait up to 6 seconds, or until a key
+        is pressed, for the user to read *message*.
 
         :param message: The Command Prompt message to show upon exit.
         """
         if self.lasterror == ERROR_ALREADY_EXISTS:
             print(message)
-            sleep(6)
+            # Need to leave console open long enough to read the exit
+            #   message, but not stall exit when no one is there to read it,
+            #   nor wait indefinitely on a console left unattended.
+            if sys.stdin and sys.stdin.isatty():
+                print('Press any key to exit now...')
+                for _ in range(60):
+                    if msvcrt.kbhit():
+                        break
+                    sleep(0.1)
             sys.exit(0)
 
-    def __del__(self):
+    def close(self) -> None:
+        """
+        Close the mutex handle; safe to call more than once.
+        The mutex is not owned (bInitialOwner is False), so there is
+        nothing to ReleaseMutex(); closing the last handle removes it.
+        """
         if self.mutex:
             CloseHandle(self.mutex)
+            self.mutex = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
 
 def exit_popup(message: str) -> None:
@@ -92,6 +135,11 @@ def exit_popup(message: str) -> None:
 
     :param message: The message to display in the exit window.
     """
+    # Import tk here so that the CLI count-tasks, and any first
+    #   instance, does not load tkinter just to check for a twin.
+    import tkinter as tk
+    from count_modules import bind_this
+
     popup = tk.Tk()
     popup.title('Close window to exit')
     popup.minsize(350, 60)
@@ -112,7 +160,7 @@ def exit_popup(message: str) -> None:
     sys.exit(0)
 
 
-def lock_or_exit(_fd: TextIO, exit_msg: str) -> None:
+def lock_or_exit(_fd: TextIO, exit_msg: str, use_lockf=False) -> None:
     """
     Lock a bespoke hidden file to serve as an instance sentinel for
     Linux and macOS platforms. Lock (or create and lock) the file
@@ -129,15 +177,56 @@ def lock_or_exit(_fd: TextIO, exit_msg: str) -> None:
         lockfile.
     :param exit_msg: The message to display upon exit when another
         instance is running with the same *_fd* file descriptor.
+    :param use_lockf: Use a POSIX fcntl.lockf() record lock instead of
+        the default BSD fcntl.flock(); use when the lockfile is on an
+        NFS mount, where flock() may only lock the local client.
     """
     # Inspired by https://stackoverflow.com/questions/380870/
     #   make-sure-only-a-single-instance-of-a-program-is-running
+    # A BSD flock() on the open file is all a single-instance sentinel
+    #   needs; it avoids the heavier POSIX record-lock path of lockf(),
+    #   and is not released when some other fd to the file is closed.
     try:
-        fcntl.lockf(_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        if use_lockf:
+            fcntl.lockf(_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            fcntl.flock(_fd.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
     except OSError:
         exit_popup(exit_msg)
 
 
+def _sentinel_dir() -> Path:
+    """
+    Get the current user's folder for sentinel files within the system
+    temp folder, so that counting sentinels need not scan every file in
+    the temp folder. The folder is created, private to the user, as
+    needed. Falls back to the temp folder itself when the user's folder
+    cannot be made or used, e.g., when its name is taken by another
+    user's folder or by a file.
+
+    :return: Path object of the folder in which to keep sentinel files.
+    """
+    # The temp folder is shared by all users on Linux and macOS, so need
+    #   a folder for each user that only that user can write to.
+    try:
+        user = getpass.getuser().translate(_TRANS_TABLE)
+    except (KeyError, OSError):  # No user name found in the environment.
+        return Path(_TEMP_DIR)
+
+    sentinel_dir = Path(_TEMP_DIR, f'{program_name()}_sentinels_{user}')
+    try:
+        sentinel_dir.mkdir(mode=0o700, exist_ok=True)
+        if hasattr(os, 'getuid') and sentinel_dir.stat().st_uid != os.getuid():
+            return Path(_TEMP_DIR)
+    except OSError:
+        return Path(_TEMP_DIR)
+
+    if not os.access(sentinel_dir, os.W_OK | os.X_OK):
+        return Path(_TEMP_DIR)
+
+    return sentinel_dir
+
+
 def sentinel_or_exit(working_dir: Path, exit_msg=None) -> tuple:
     """
     Create a temporary empty binary file to serve as an instance
@@ -168,21 +257,31 @@ def sentinel_or_exit(working_dir: Path, exit_msg=None) -> tuple:
         running from the *working_dir*.
     :return: tuple of (current sentinel's TemporaryFileWrapper object,
         integer count of sentinel files with a matching prefix in the
-        system's temporary file folder)
+        user's sentinel folder within the system's temporary file
+        folder)
     """
 
-    workdir = str(working_dir.resolve())
-
-    # Need to remove problematic path characters from sentinel file name.
-    trans_table = workdir.maketrans('\\/: ', '____')
-    workdir_id = workdir.translate(trans_table)
+    workdir_id = str(working_dir.resolve()).translate(_TRANS_TABLE)
     sentinel_prefix = f'sentinel_{workdir_id}_{program_name()}_'
-    temp_dir = gettempdir()
-
-    sentinel = NamedTemporaryFile(mode='rb', prefix=sentinel_prefix)
 
-    sentinel_count = len(
-        tuple(Path(temp_dir).glob(f'{sentinel_prefix}*')))
+    # Unlike a shared counter file, a count of live sentinel files cannot
+    #   be left stale when an instance crashes before it can decrement.
+    sentinel_dir = _sentinel_dir()
+
+    # The sentinel is never read or written, so an unbuffered file object
+    #   will do. NamedTemporaryFile is kept over a bare os.open() because
+    #   Windows then deletes the file on close, even if the app crashes.
+    # Need to create this instance's sentinel before counting, so that of
+    #   two instances started at once, at least one counts both sentinels.
+    sentinel = NamedTemporaryFile(mode='rb', buffering=0,
+                                  prefix=sentinel_prefix, dir=sentinel_dir)
+
+    # The count includes this instance's own sentinel.
+    # A plain prefix match on scandir() entry names needs no stat calls
+    #   and no Path objects, unlike a glob of the folder.
+    with os.scandir(sentinel_dir) as entries:
+        sentinel_count = sum(1 for entry in entries
+                             if entry.name.startswith(sentinel_prefix))
 
     # The first instance from a logfile dir will return variables
     #   to the main script. Subsequent instances, when this function
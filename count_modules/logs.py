@@ -1,21 +1,23 @@
 """
 Methods to analyze and view BOINC task data logged to file.
 
-Class Logs, functions: analyze_logfile, plot_data, plot_data_toggle,
-                       plot_display, show_analysis, uptime
+Class Logs, functions: analyze_logfile, parse_logfile, plot_date_nums,
+                       plot_data, plot_data_toggle, plot_display,
+                       show_analysis, uptime
 Functions: close_plots
 
 """
 # Copyright (C) 2021-2024 C. Echt under GNU General Public License'
 
 
+import re
 import sys
 import tkinter as tk
+from datetime import datetime
+from itertools import chain
 from pathlib import Path
-from re import search, findall, MULTILINE
 from socket import gethostname
 from tkinter import messagebox, ttk
-from tkinter.scrolledtext import ScrolledText
 
 try:
     import matplotlib.dates as mdates
@@ -37,14 +39,41 @@ from count_modules import (bind_this as Binds,
                            instances,
                            times as T,
                            utils as Utils)
+from count_modules.config_constants import MY_OS
 
 PROGRAM_NAME = instances.program_name()
-MY_OS = sys.platform[:3]
+
+# The host name does not change while running, so look it up just once
+#   for the window titles and error messages that show it.
+HOSTNAME = gethostname()
 
 # Datetime string formats used in logging and analysis reporting.
 LONG_STRFTIME = '%Y-%b-%d %H:%M:%S'
 SHORT_STRFTIME = '%Y %b %d %H:%M'
 
+# Regex pattern for Summary, Interval, and counting start log entries,
+#   compiled once for a single pass over the log in parse_logfile(); see
+#   the log entry structure noted there. Groups, in order: date, summary
+#   interval time, summary count, interval time, interval count, for
+#   interval entries the avg, min, and max task times, and the flag for a
+#   start entry, which uptime() needs.
+# The range is optional within the avg capture because sec_to_format()
+#   logs a task time of a day or more as 'Nd HH:MM:SS'; such a range is
+#   skipped, as before, but its interval's avg is still kept so that the
+#   avg times stay aligned with the interval counts used as weights.
+# Entry lines begin with a 'YYYY-' datetime, so tethering the datetime
+#   group to that start lets the many indented data lines fail at their
+#   first character instead of being scanned to their end, and the
+#   [^;\n] class keeps the group from backtracking past the '; '.
+LOG_ENTRY_RE = re.compile(
+    r'^(?P<date>\d{4}-[^;\n]*); '
+    r'(?:>>> SUMMARY: [^\n]* (?P<sumry_t>\d+[mhd]): (?P<sumry_cnt>\d+)$'
+    r'|Tasks reported [^\n]* (?P<intvl_t>\d+[mhd]): (?P<intvl_cnt>\d+)$'
+    r'(?:\n[^\n]* avg (?P<avgt>\d{2}:\d{2}:\d{2})[^\n]*'
+    r'(?:\n[^\n]* range \[(?P<mint>\d{2}:\d{2}:\d{2}) -- (?P<maxt>\d{2}:\d{2}:\d{2})])?)?'
+    r'|[^\n]*(?P<start>most recent BOINC report))',
+    re.MULTILINE)
+
 # Colors used for Matplotlib plots. Default marker color 'blue' is '#bfd1d4',
 #   similar to X11 SteelBlue4 or DodgerBlue4 used by tkinter.
 MARKER_COLOR2 = 'deepskyblue' # DeepSkyBlue, '#00bfff'
@@ -53,17 +82,20 @@ LIGHT_COLOR = '#d9d9d9'  # X11 gray85; X11 gray80 '#cccccc'
 DARK_BG = '#333333'  # X11 gray20
 
 
-def close_plots(window: tk.Toplevel) -> None:
+def close_plots(window: tk.Toplevel, fig: 'plt.Figure') -> None:
     """
-    Explicitly close all matplotlib objects and their parent tk window
+    Explicitly close the matplotlib figure and its parent tk window
     when the user closes the plot window with the system's built-in
     close window icon ("X").
     This is required to cleanly exit and close the thread running
     Matplotlib.
 
     :param window: The parent window being closed with a click on X.
+    :param fig: The matplotlib figure drawn in *window*.
     """
-    plt.close('all')
+    # Close only this window's figure so that any other open plot
+    #   windows keep theirs.
+    plt.close(fig)
     window.destroy()
 
 
@@ -85,6 +117,35 @@ class Logs:
         LOGFILE = Path(Path.home(), f'{PROGRAM_NAME}_log.txt').resolve()
         ANALYSISFILE = Path(Path.home(), f'{PROGRAM_NAME}_analysis.txt').resolve()
 
+    # Log entries found by the most recent analyze_logfile() parse, as
+    #   (file key, parsed data), where the key is (path, mtime_ns, size).
+    LOG_CACHE = ()
+
+    # The (size, mtime_ns) of the example log when it last passed the
+    #   Utils.verify() hash check, so that check need not be repeated
+    #   for an unchanged file.
+    EXAMPLE_VERIFIED = ()
+
+    # Matplotlib date numbers of the cached log entries, as (file key,
+    #   plot data), so that repeat plots of an unchanged log need not
+    #   convert the same date and time strings again.
+    PLOT_CACHE = ()
+
+    # view() window minimum (width, height) and file-not-found query for
+    #   the log and analysis files. Need platform-specific window widths so
+    #   as not to hide Buttons; widths depend on each platform's TkFixedFont
+    #   width in the window's text. Resolved once here for this platform.
+    VIEW_CFG = {
+        'log': ({'lin': 800, 'win': 840, 'dar': 675}.get(MY_OS, 0), 220,
+                'Was the log option ticked in settings?'),
+        'analysis': (550 if MY_OS == 'win' else 510, 150,
+                     'Have any analysis results been saved yet?'),
+    }
+
+    # Report texts of the most recent full analysis, as (file key, texts),
+    #   returned as-is while the log file is unchanged.
+    REPORT_CACHE = ()
+
     @classmethod
     def analyze_logfile(cls, do_plot=False, do_test=False) -> tuple:
         """
@@ -101,8 +162,13 @@ class Logs:
         """
 
         cls.DO_TEST = do_test
+        # Callers that ask only for a plot do not use the returned texts.
+        #   A test run also plots, but then shows the analysis, too.
+        plot_only = do_plot and not do_test
+
         sumry_dates = []
         sumry_intvl_vals = []
+        sumry_intvl_set = set()
         num_sumry_intvl_vals = 0
         sumry_counts = []
         sumry_cnt_avg = 0.0
@@ -111,6 +177,7 @@ class Logs:
         intvl_dates = []
         intvl_counts = []
         intvl_vals = []
+        intvl_set = set()
         num_intvl_vals = 0
         intvl_cnt_avg = 0.0
         intvl_cnt_range = ''
@@ -118,6 +185,7 @@ class Logs:
 
         recent_dates = []
         recent_intvl_vals = []
+        recent_intvl_set = set()
         num_recent_intvl_vals = 0
         recent_counts = []
         num_recent_tasks = 0
@@ -127,10 +195,11 @@ class Logs:
         summary_text = ''
         recent_interval_text = ''
 
+        logfile = cls.LOGFILE
         try:
-            logtext: str = Path(cls.LOGFILE).read_text(encoding='utf-8')
+            log_stat = logfile.stat()
         except FileNotFoundError:
-            info = (f'On {gethostname()}, missing necessary file:\n{cls.LOGFILE}\n'
+            info = (f'On {HOSTNAME}, missing necessary file:\n{cls.LOGFILE}\n'
                     'Was the settings "log results" option used?\n'
                     'Was the log file deleted, moved or renamed?')
             messagebox.showerror(title='FILE NOT FOUND', detail=info)
@@ -139,14 +208,8 @@ class Logs:
 
         if cls.DO_TEST:
             try:
-                logtext: str = Path(cls.EXAMPLELOG).read_text(encoding='utf-8')
-                texthash: int = Utils.verify(logtext)
-                if texthash != 4006408145:  # As of 06:41 4 June 2022.
-                    msg = (f'Content of {cls.EXAMPLELOG} has changed, so'
-                           ' the test may not work. If not working, reinstall'
-                           f' the example file from {CMod.__project_url__}')
-                    messagebox.showinfo(title='EXAMPLE LOG DATA MAY BE CORRUPT',
-                                        detail=msg)
+                log_stat = cls.EXAMPLELOG.stat()
+                logfile = cls.EXAMPLELOG
                 do_plot = True
             except FileNotFoundError:
                 info = (f'Missing example file:\n{cls.EXAMPLELOG}\n'
@@ -154,46 +217,49 @@ class Logs:
                         f'Try reinstalling it from {CMod.__project_url__}.')
                 messagebox.showerror(title='FILE NOT FOUND', detail=info)
 
-        # Regex is based on this structure used in CountModeler.log_it():
-        """
-        2021-Dec-21 06:27:18; Tasks reported in the past 1h: 18
-                              Task Time: avg 00:21:35,
-                                         range [00:21:20 -- 00:21:54],
-                                         stdev 00:00:11, total 06:28:45
-                              Total tasks in queue: 53
-                              984 counts remain.
-        2021-Dec-21 06:27:18; >>> SUMMARY: Task count for the past 1d: 402
-                              Task Time: mean 0:21:28,
-                                         range [00:16:03 -- 00:22:33],
-                                         stdev 00:00:42, total 5d 23:54:05
-        """
-        found_sumrys: list = findall(
-            r'^(.*); >>> SUMMARY: .+ (\d+[mhd]): (\d+$)',
-            string=logtext, flags=MULTILINE)
-
-        found_intvls: list = findall(
-            r'^(.*); Tasks reported .+ (\d+[mhd]): (\d+$)',
-            string=logtext, flags=MULTILINE)
-        found_intvl_avgt: list = findall(
-            r'Tasks reported .+\n.+ avg (\d{2}:\d{2}:\d{2})',
-            string=logtext, flags=MULTILINE)
-        found_intvl_t_range: list = findall(
-            r'Tasks reported .+\n.+\n.+ range \[(\d{2}:\d{2}:\d{2}) -- (\d{2}:\d{2}:\d{2})]',
-            string=logtext, flags=MULTILINE)
+        # Need to read and parse the file only when it has changed since
+        #   the last analysis or plot; otherwise reuse the cached entries.
+        log_key = (logfile, log_stat.st_mtime_ns, log_stat.st_size)
+
+        # An unchanged log gives the same report, so reuse it, unless there
+        #   is also a plot to draw.
+        if not do_plot and cls.REPORT_CACHE and cls.REPORT_CACHE[0] == log_key:
+            return cls.REPORT_CACHE[1]
+
+        if cls.LOG_CACHE and cls.LOG_CACHE[0] == log_key:
+            (found_sumrys, found_intvls, found_intvl_avgt,
+             found_intvl_t_range, uptime_hrs) = cls.LOG_CACHE[1]
+        else:
+            (found_sumrys, found_intvls, found_intvl_avgt,
+             found_intvl_t_range, uptime_hrs) = cls.parse_logfile(logfile)
+            cls.LOG_CACHE = (log_key, (found_sumrys, found_intvls, found_intvl_avgt,
+                                       found_intvl_t_range, uptime_hrs))
+
+        # When just plotting, skip the report statistics and texts.
+        if plot_only:
+            if found_intvls:
+                intvl_dates, intvl_vals, intvl_counts = zip(*found_intvls)
+            cls.check_for_plotting(do_plot=True,
+                                   intervals=found_intvls,
+                                   args=(intvl_dates, found_intvl_avgt,
+                                         found_intvl_t_range,
+                                         intvl_counts, intvl_vals))
+            return summary_text, recent_interval_text
 
         if found_sumrys:
-            sumry_dates, sumry_intvl_vals, sumry_cnts = zip(*found_sumrys)
-            num_sumry_intvl_vals = len(set(sumry_intvl_vals))
-            sumry_counts = list(map(int, sumry_cnts))
+            sumry_dates, sumry_intvl_vals, sumry_counts = zip(*found_sumrys)
+            # Build each set of unique interval times once for reuse below.
+            sumry_intvl_set = set(sumry_intvl_vals)
+            num_sumry_intvl_vals = len(sumry_intvl_set)
             sumry_cnt_avg = round(sum(sumry_counts) / len(sumry_counts), 1)
             sumry_cnt_range = f'[{min(sumry_counts)} -- {max(sumry_counts)}]'
 
         if found_intvls:
-            intvl_dates, intvl_vals, intvl_cnts = zip(*found_intvls)
-            num_intvl_vals = len(set(intvl_vals))
-            intvl_counts = list(map(int, intvl_cnts))
+            intvl_dates, intvl_vals, intvl_counts = zip(*found_intvls)
+            intvl_set = set(intvl_vals)
+            num_intvl_vals = len(intvl_set)
             num_tasks = sum(intvl_counts)
-            intvl_cnt_avg = round(sum(intvl_counts) / len(intvl_counts), 1)
+            intvl_cnt_avg = round(num_tasks / len(intvl_counts), 1)
             intvl_cnt_range = f'[{min(intvl_counts)} -- {max(intvl_counts)}]'
             intvl_t_wtmean: str = T.logtimes_stat(distribution=found_intvl_avgt,
                                                   stat='weighted_mean',
@@ -202,36 +268,37 @@ class Logs:
                                                  stat='stdev',
                                                  weights=intvl_counts)
 
-            # https://www.geeksforgeeks.org/python-convert-list-of-tuples-into-list/
-            # Note: using an empty tuple as a sum() starting value flattens the
-            #    list of string tuples into one tuple of strings.
-            intvl_t_range: str = T.logtimes_stat(distribution=sum(found_intvl_t_range, ()),
-                                                 stat='range')
+            # Need to flatten the list of (min, max) string tuples into one
+            #   tuple of strings. chain.from_iterable() does so in linear time,
+            #   whereas sum() with a tuple start copies the tuple at each step.
+            intvl_t_range: str = T.logtimes_stat(
+                distribution=tuple(chain.from_iterable(found_intvl_t_range)),
+                stat='range')
 
             # Text & data used in most count reporting conditions below:
-            if len(set(intvl_vals)) == 1:
+            if num_intvl_vals == 1:
                 logged_intvl_report = (
                     'Analysis of reported tasks logged from\n'
                     f'{intvl_dates[0]} to {intvl_dates[-1]}\n'
-                    f'   {cls.uptime(logtext).ljust(11)} hours counting tasks\n'
-                    f'   {str(num_tasks).ljust(11)} tasks in {len(intvl_counts)} count intervals\n'
-                    f'   {str(intvl_cnt_avg).ljust(11)} tasks per {intvl_vals[0]} count interval\n'
-                    f'   {intvl_t_wtmean.ljust(11)} weighted mean task time\n'
-                    f'   {intvl_t_stdev.ljust(11)} std deviation task time\n'
+                    f'   {uptime_hrs:<11} hours counting tasks\n'
+                    f'   {num_tasks:<11} tasks in {len(intvl_counts)} count intervals\n'
+                    f'   {intvl_cnt_avg:<11} tasks per {intvl_vals[0]} count interval\n'
+                    f'   {intvl_t_wtmean:<11} weighted mean task time\n'
+                    f'   {intvl_t_stdev:<11} std deviation task time\n'
                     f'   {intvl_t_range} range of task times\n\n'
                 )
             else:
                 logged_intvl_report = (
                     'Analysis of reported tasks logged from\n'
                     f'{intvl_dates[0]} to {intvl_dates[-1]}\n'
-                    f'   {cls.uptime(logtext).ljust(11)} hours counting tasks\n'
-                    f'   {str(num_tasks).ljust(11)} tasks in {len(intvl_counts)} count intervals\n'
-                    f'   {str(intvl_cnt_avg).ljust(11)} tasks per various length count interval\n'
-                    f'   {intvl_t_wtmean.ljust(11)} weighted mean task time\n'
-                    f'   {intvl_t_stdev.ljust(11)} std deviation task time\n'
+                    f'   {uptime_hrs:<11} hours counting tasks\n'
+                    f'   {num_tasks:<11} tasks in {len(intvl_counts)} count intervals\n'
+                    f'   {intvl_cnt_avg:<11} tasks per various length count interval\n'
+                    f'   {intvl_t_wtmean:<11} weighted mean task time\n'
+                    f'   {intvl_t_stdev:<11} std deviation task time\n'
                     f'   {intvl_t_range} range of task times\n\n'
-                    f'{len(set(intvl_vals))} different interval lengths are logged:\n'
-                    f'   {set(intvl_vals)},\n'
+                    f'{num_intvl_vals} different interval lengths are logged:\n'
+                    f'   {intvl_set},\n'
                     '   so interpret results with caution.\n')
 
         else:  # No interval counts found.
@@ -260,11 +327,19 @@ class Logs:
                 if intvl_dates[-1] == sumry_dates[-1]:
                     recent_intervals = False
                 else:
-                    index = [i for i, date in enumerate(intvl_dates) if date == sumry_dates[-1]]
-                    index_recent = index[0] + 1  # <- The interval after the last summary.
-                    recent_dates, recent_intvl_vals, recent_cnts = zip(*found_intvls[index_recent:])
-                    num_recent_intvl_vals = len(set(recent_intvl_vals))
-                    recent_counts = list(map(int, recent_cnts))
+                    # The interval counted at the same time as the last
+                    #   summary is near the end, so scan back from the end.
+                    #   Date strings do not sort chronologically, so a
+                    #   bisect of intvl_dates is not an option.
+                    for i in range(len(intvl_dates) - 1, -1, -1):
+                        if intvl_dates[i] == sumry_dates[-1]:
+                            index_recent = i + 1  # <- The interval after the last summary.
+                            break
+                    else:
+                        raise IndexError('No interval matches the last summary.')
+                    recent_dates, recent_intvl_vals, recent_counts = zip(*found_intvls[index_recent:])
+                    recent_intvl_set = set(recent_intvl_vals)
+                    num_recent_intvl_vals = len(recent_intvl_set)
                     num_recent_tasks = sum(recent_counts)
                     recent_t_wtmean = T.logtimes_stat(
                         distribution=found_intvl_avgt[index_recent:],
@@ -284,15 +359,15 @@ class Logs:
             if num_intvl_vals == 1:
                 recent_interval_text = (
                     f'{logged_intvl_report}'
-                    f'   {str(intvl_cnt_avg).ljust(11)} tasks per {intvl_vals[0]} count interval\n'
+                    f'   {intvl_cnt_avg:<11} tasks per {intvl_vals[0]} count interval\n'
                     f'   {intvl_cnt_range} range of task counts\n'
                 )
             else:
                 recent_interval_text = (
                     f'{logged_intvl_report}'
-                    f'   {str(intvl_cnt_avg).ljust(11)} tasks per count interval\n'
+                    f'   {intvl_cnt_avg:<11} tasks per count interval\n'
                     f'There are {num_intvl_vals} different interval durations\n'
-                    f'logged: {", ".join(set(intvl_vals))},\n'
+                    f'logged: {", ".join(intvl_set)},\n'
                     'so interpret results with caution.\n\n'
                 )
 
@@ -302,8 +377,8 @@ class Logs:
                     f'{logged_intvl_report}'
                     'Summary data logged from:\n'
                     f'{sumry_dates[0]} to {sumry_dates[-1]}\n'
-                    f'   {str(len(sumry_counts)).ljust(7)} summaries logged\n'
-                    f'   {str(sumry_cnt_avg).ljust(7)}'
+                    f'   {len(sumry_counts):<7} summaries logged\n'
+                    f'   {sumry_cnt_avg:<7}'
                     f' tasks per {sumry_intvl_vals[0]} summary interval\n'
                     f'   {sumry_cnt_range} range of task counts\n\n'
                 )
@@ -312,11 +387,11 @@ class Logs:
                     f'{logged_intvl_report}'
                     'Summary data logged from:\n'
                     f'{sumry_dates[0]} to {sumry_dates[-1]}\n\n'
-                    f'   {str(len(sumry_counts)).ljust(7)} summaries logged\n'
-                    f'   {str(sumry_cnt_avg).ljust(7)} tasks per summary\n'
+                    f'   {len(sumry_counts):<7} summaries logged\n'
+                    f'   {sumry_cnt_avg:<7} tasks per summary\n'
                     f'   {sumry_cnt_range} range of task counts\n'
                     f'There are {num_sumry_intvl_vals} different Summary interval times,\n'
-                    f'   {set(sumry_intvl_vals)},\n'
+                    f'   {sumry_intvl_set},\n'
                     '   so interpret results with caution.\n\n'
                 )
 
@@ -326,24 +401,100 @@ class Logs:
                 recent_interval_text = (
                     'Since last Summary, additional counts from:\n'
                     f'{recent_dates[0]} to {recent_dates[-1]}\n'
-                    f'   {str(num_recent_tasks).ljust(11)} '
+                    f'   {num_recent_tasks:<11} '
                     f'tasks in {len(recent_counts)} intervals of {recent_intvl_vals[0]}\n'
-                    f'   {recent_t_wtmean.ljust(11)} weighted mean task time\n'
+                    f'   {recent_t_wtmean:<11} weighted mean task time\n'
                 )
             else:
                 recent_interval_text = (
                     'Since last Summary, additional counts from:\n'
                     f'{recent_dates[0]} to {recent_dates[-1]}\n\n'
-                    f'   {str(num_recent_tasks).ljust(11)} '
+                    f'   {num_recent_tasks:<11} '
                     f'tasks in {len(recent_counts)} intervals of {recent_intvl_vals[0]}\n'
-                    f'   {recent_t_wtmean.ljust(11)} weighted mean task time\n'
+                    f'   {recent_t_wtmean:<11} weighted mean task time\n'
                     f'There are {num_recent_intvl_vals} different interval lengths,\n'
-                    f'   {set(recent_intvl_vals)},\n'
+                    f'   {recent_intvl_set},\n'
                     '   so interpret results with caution.\n'
                 )
 
+        # Only reports with interval counts are cached, so that a log
+        #   with none still gets its 'No counts available' notice.
+        if found_intvls:
+            cls.REPORT_CACHE = (log_key, (summary_text, recent_interval_text))
+
         return summary_text, recent_interval_text
 
+    @classmethod
+    def parse_logfile(cls, logfile: Path) -> tuple:
+        """
+        Find all Summary and Interval count entries in *logfile*.
+        Called from analyze_logfile() when *logfile* has changed since
+        it was last parsed.
+
+        :param logfile: Path object of the log file to parse.
+        :return: tuple of lists of (found_sumrys, found_intvls,
+            found_intvl_avgt, found_intvl_t_range) and the uptime()
+            hours string ('' when there are no interval counts).
+            Summary and interval entries are (date, interval time,
+            count) tuples, with the count as an integer.
+        """
+        logtext: str = logfile.read_text(encoding='utf-8')
+
+        if logfile == cls.EXAMPLELOG:
+            ex_stat = logfile.stat()
+            ex_key = (ex_stat.st_size, ex_stat.st_mtime_ns)
+            if ex_key != cls.EXAMPLE_VERIFIED:
+                texthash: int = Utils.verify(logtext)
+                if texthash == 4006408145:  # As of 06:41 4 June 2022.
+                    cls.EXAMPLE_VERIFIED = ex_key
+                else:
+                    msg = (f'Content of {cls.EXAMPLELOG} has changed, so'
+                           ' the test may not work. If not working, reinstall'
+                           f' the example file from {CMod.__project_url__}')
+                    messagebox.showinfo(title='EXAMPLE LOG DATA MAY BE CORRUPT',
+                                        detail=msg)
+
+        # Regex is based on this structure used in CountModeler.log_it():
+        """
+        2021-Dec-21 05:27:18; Number of tasks in the most recent BOINC report: 18
+        ...
+        2021-Dec-21 06:27:18; Tasks reported in the past 1h: 18
+                              Task Time: avg 00:21:35,
+                                         range [00:21:20 -- 00:21:54],
+                                         stdev 00:00:11, total 06:28:45
+                              Total tasks in queue: 53
+                              984 counts remain.
+        2021-Dec-21 06:27:18; >>> SUMMARY: Task count for the past 1d: 402
+                              Task Time: mean 0:21:28,
+                                         range [00:16:03 -- 00:22:33],
+                                         stdev 00:00:42, total 5d 23:54:05
+        """
+        found_sumrys = []
+        found_intvls = []
+        found_intvl_avgt = []
+        found_intvl_t_range = []
+        # The dates of counting start and interval entries, in log order,
+        #   flagged True for a start; used for uptime().
+        start_intvl_dates = []
+        for (date, sumry_t, sumry_cnt, intvl_t, intvl_cnt,
+             avgt, mint, maxt, start) in LOG_ENTRY_RE.findall(logtext):
+            if sumry_cnt:
+                found_sumrys.append((date, sumry_t, int(sumry_cnt)))
+            elif start:
+                start_intvl_dates.append((date, True))
+            else:
+                found_intvls.append((date, intvl_t, int(intvl_cnt)))
+                start_intvl_dates.append((date, False))
+                if avgt:
+                    found_intvl_avgt.append(avgt)
+                if mint:
+                    found_intvl_t_range.append((mint, maxt))
+
+        uptime_hrs = cls.uptime(start_intvl_dates) if found_intvls else ''
+
+        return (found_sumrys, found_intvls, found_intvl_avgt,
+                found_intvl_t_range, uptime_hrs)
+
     @ classmethod
     def check_log_size(cls) -> None:
         """
@@ -368,13 +519,24 @@ class Logs:
 
         :param do_plot: When True, call plot_data().
         :param intervals: List of interval counts found in log file.
-        :param args: Tuple of interval data lists to plot; a passthrough
-                     to plot_data().
+        :param args: Tuple of interval data to plot: (intvl_dates,
+                     found_intvl_avgt, found_intvl_t_range, intvl_counts,
+                     intvl_vals). The dates and times are converted
+                     to Matplotlib date numbers for plot_data().
         :return: None
         """
         if do_plot and 'matplotlib' in sys.modules:
             if intervals:
-                cls.plot_data(*args)
+                intvl_dates, found_intvl_avgt, found_intvl_t_range, *counts_vals = args
+                log_key = cls.LOG_CACHE[0]
+                if cls.PLOT_CACHE and cls.PLOT_CACHE[0] == log_key:
+                    date_nums = cls.PLOT_CACHE[1]
+                else:
+                    date_nums = cls.plot_date_nums(intvl_dates,
+                                                   found_intvl_avgt,
+                                                   found_intvl_t_range)
+                    cls.PLOT_CACHE = (log_key, date_nums)
+                cls.plot_data(*date_nums, *counts_vals)
             else:
                 messagebox.showinfo(
                     title='No counts available',
@@ -386,10 +548,43 @@ class Logs:
                 detail='Install Matplotlib with: pip install -U matplotlib'
             )
 
+    @staticmethod
+    def plot_date_nums(intvl_dates: list,
+                       found_intvl_avgt: list,
+                       found_intvl_t_range: list) -> tuple:
+        """
+        Convert interval datetime strings and task time strings to
+        Matplotlib date numbers for plotting.
+        Called from check_for_plotting().
+
+        :param intvl_dates: List of datetime strings for interval counts.
+        :param found_intvl_avgt: List of task completion times for intervals.
+        :param found_intvl_t_range: List of min and max task times for intervals.
+        :return: tuple of date number arrays (tdates, ttimes, mintimes,
+            maxtimes).
+        """
+        # The string formats are known, so parse them with strptime() rather
+        #   than with the much slower generic parser of datestr2num(), then
+        #   convert each whole list in one date2num() call. Task times all get
+        #   the strptime() default date, which the y-axis formatter ignores.
+        tdates = mdates.date2num(
+            [datetime.strptime(d, LONG_STRFTIME) for d in intvl_dates])
+        ttimes = mdates.date2num(
+            [datetime.strptime(t, '%H:%M:%S') for t in found_intvl_avgt])
+
+        mins, maxs = zip(*found_intvl_t_range)
+        mintimes = mdates.date2num(
+            [datetime.strptime(m, '%H:%M:%S') for m in mins])
+        maxtimes = mdates.date2num(
+            [datetime.strptime(m, '%H:%M:%S') for m in maxs])
+
+        return tdates, ttimes, mintimes, maxtimes
+
     @classmethod
-    def plot_data(cls, intvl_dates: list,
-                  found_intvl_avgt: list,
-                  found_intvl_t_range: list,
+    def plot_data(cls, tdates,
+                  ttimes,
+                  mintimes,
+                  maxtimes,
                   intvl_counts: list,
                   intvl_vals: list) -> None:
 
@@ -399,11 +594,12 @@ class Logs:
         The plot will be navigable via toolbar buttons on Linux and
         Windows platforms, not on macOS.
         Parameter lists of data distributions need to be same length.
-        Called from analyze_logfile() when do_plot=True.
+        Called from check_for_plotting() when do_plot=True.
 
-        :param intvl_dates: List of datetime strings for interval counts.
-        :param found_intvl_avgt: List of task completion times for intervals.
-        :param found_intvl_t_range: List of min and max task times for intervals.
+        :param tdates: Date numbers of interval count datetimes.
+        :param ttimes: Date numbers of interval avg. task times.
+        :param mintimes: Date numbers of interval min task times.
+        :param maxtimes: Date numbers of interval max task times.
         :param intvl_counts: List of task counts for intervals.
         :param intvl_vals: List of unique time durations of intervals.
 
@@ -423,13 +619,15 @@ class Logs:
             medium_font = 10
             bigger_font = 12
 
-        # Initialize fig Figure for Windows, adjust platform-specific sizes:
-        fig, ax1 = plt.subplots(figsize=(7.25, 5.75), constrained_layout=True)
-
+        # Need platform-specific figure sizes; create the Figure only once
+        #   so that no unused Figure is left in pyplot's figure registry.
         if MY_OS == 'lin':
-            fig, ax1 = plt.subplots(figsize=(8, 6), constrained_layout=True)
+            figsize = (8, 6)
         elif MY_OS == 'dar':
-            fig, ax1 = plt.subplots(figsize=(6.5, 5), constrained_layout=True)
+            figsize = (6.5, 5)
+        else:  # is 'win'
+            figsize = (7.25, 5.75)
+        fig, ax1 = plt.subplots(figsize=figsize, constrained_layout=True)
 
         if cls.DO_TEST:
             ax1.set_title('-- TEST PLOTS of EXAMPLE LOG DATA --',
@@ -451,18 +649,11 @@ class Logs:
         ax1.tick_params(axis='x', which='both', colors=LIGHT_COLOR)
         ax1.tick_params(axis='y', which='both', colors=LIGHT_COLOR)
 
-        # Need to convert intvl_dates and found_intvl_avgt strings to Matplotlib dates;
-        #   this greatly speeds up plotting when axes are date objects.
+        # Dates and times are given as Matplotlib date numbers, which
+        #   greatly speeds up plotting when axes are date objects.
         ax1.xaxis.axis_date()
         ax1.yaxis.axis_date()
 
-        tdates = [mdates.datestr2num(d) for d in intvl_dates]
-        ttimes = [mdates.datestr2num(t) for t in found_intvl_avgt]
-
-        mins, maxs = zip(*found_intvl_t_range)
-        mintimes = [mdates.datestr2num(m) for m in mins]
-        maxtimes = [mdates.datestr2num(m) for m in maxs]
-
         ax1.scatter(tdates, mintimes, marker='^', s=6,
                     color=MARKER_COLOR3,
                     label='min time')
@@ -511,8 +702,8 @@ class Logs:
 
     @staticmethod
     def plot_data_toggle(button: tk.Button,
-                         figure: plt.Axes,
-                         axis: plt.Axes,
+                         figure: 'plt.Axes',
+                         axis: 'plt.Axes',
                          xdata: list,
                          ydata: list) -> None:
         """
@@ -552,8 +743,8 @@ class Logs:
 
     @classmethod
     def plot_display(cls,
-                     fig: plt.Axes,
-                     ax2: plt.Axes,
+                     fig: 'plt.Axes',
+                     ax2: 'plt.Axes',
                      tdates: list,
                      tcounts: list,
                      intvl_length: str) -> None:
@@ -582,7 +773,7 @@ class Logs:
         plotwin.rowconfigure(4, weight=1)
         plotwin.columnconfigure(0, weight=1)
         plotwin.configure(bg=DARK_BG)
-        plotwin.protocol('WM_DELETE_WINDOW', lambda: close_plots(plotwin))
+        plotwin.protocol('WM_DELETE_WINDOW', lambda: close_plots(plotwin, fig))
 
         # Put the plot and toolbar drawing areas onto a Canvas, which
         #   will then be put in a Frame().
@@ -680,7 +871,9 @@ class Logs:
 
         insert_txt = summary_text + recent_interval_text
 
-        max_line = len(max(insert_txt.splitlines(), key=len))
+        # Get the widest line and the line count from one split of the text.
+        lines = insert_txt.split('\n')
+        max_line = max(map(len, lines))
 
         # Separator dash from https://coolsymbol.com/line-symbols.html.
         # print(ord("─")) -> 9472
@@ -689,7 +882,8 @@ class Logs:
         #   unicodedata.name(chr(9552)) -> 'BOX DRAWINGS DOUBLE HORIZONTAL'.
         sep = f'\n{"─" * max_line}\n'
         insert_txt += sep
-        num_lines = insert_txt.count('\n')
+        # The sep adds two newlines to the len(lines) - 1 already in the text.
+        num_lines = len(lines) + 1
 
         analysistxt = tk.Text(analysiswin, font='TkFixedFont',
                               width=max_line, height=num_lines,
@@ -718,50 +912,64 @@ class Logs:
                          lambda _: cls.view(cls.ANALYSISFILE, tk_obj))
 
     @staticmethod
-    def uptime(logtext: str) -> str:
+    def uptime(start_intvl_dates: list) -> str:
         """
         Sum of hours spent counting tasks. Does not include time
         segments with no reported tasks counts.
 
-        :param logtext: the full text content string from a log file.
+        :param start_intvl_dates: List of (datetime string, is_start)
+            tuples, in log order, for the counting start and interval
+            count entries found by parse_logfile().
         :return: total hours elapsed while logging data, as string.
                  Returns 'cannot determine' if negative time calculated,
                  as indication of corrupted data or user edit.
         """
         start2intvls = []
-        intvl_duration = []
 
-        # start_dt is a datetime.timedelta object, so initialize with
-        #    formatted Epoch origin time.
-        start_dt = T.str2dt('1970-Jan-01 00:00:00', LONG_STRFTIME)
+        # strptime() is by far the slowest step here, and the many interval
+        #   entries logged on the same day share a date, so parse each date
+        #   only once and add the H:M:S to it as integer seconds.
+        day_fmt = LONG_STRFTIME.split(' ', 1)[0]
+        day_secs = {}
+
+        def dt_seconds(dt_str: str) -> int:
+            day, hms = dt_str.split(' ', 1)
+            if day not in day_secs:
+                day_secs[day] = datetime.strptime(day, day_fmt).toordinal() * 86400
+            hrs, mins, secs = hms.split(':')
+            return day_secs[day] + int(hrs) * 3600 + int(mins) * 60 + int(secs)
+
+        # Initialize the start time with the Epoch origin time.
+        start_sec = dt_seconds('1970-Jan-01 00:00:00')
 
         # Need to calc uptime hours for all start-to-finish segments that
         #   have interval task counts.
         # Datetimes that begin each log entry are formatted as,
         #    '2021-Dec-05 16:33:49; ...'; LONG_FMT is the time
-        #     format used in the log file.
-        for line in logtext.split('\n'):
-            if 'most recent BOINC report' in line:
-                starttime_match = search(
-                    r'^(.+); .+ most recent BOINC report', line).group(1)
-                start_dt = T.str2dt(starttime_match, LONG_STRFTIME)
-            if 'Tasks reported' in line:
-                intvltime_match = search(
-                    r'^(.+); Tasks reported', line).group(1)
-                interval_dt = T.str2dt(intvltime_match, LONG_STRFTIME)
-                start2intvls.append(T.duration('hours', start_dt, interval_dt))
-                if any(hr < 0 for hr in start2intvls):
+        #     format used in the log file. They were split off by the
+        #     same regex pass that found the interval counts.
+        for dt_str, is_start in start_intvl_dates:
+            if is_start:
+                start_sec = dt_seconds(dt_str)
+            else:
+                hours = (dt_seconds(dt_str) - start_sec) / 3600
+                # Only the newest value needs checking; any earlier
+                #   negative value would already have returned.
+                if hours < 0:
                     return 'cannot determine'
+                start2intvls.append(hours)
 
-        # To calculate total interval hours, need a list of local maximums
-        #    from all logged start-to-finish segments of count intervals.
+        # To calculate total interval hours, need the sum of local maximums
+        #    from all logged start-to-finish segments of count intervals,
+        #    i.e., each value followed by a smaller one, plus the last value.
+        #    Pairing each value with the next one lets sum() do the scan
+        #    without indexing or building a list of the maximums.
         # There is no need for condition of no logged interval hours b/c
         #    this is only called from analyze_logfile() when there are hrs.
-        for i, _hr in enumerate(start2intvls):
-            if len(start2intvls) == 1 or i == len(start2intvls) - 1 or start2intvls[i + 1] < _hr:
-                intvl_duration.append(_hr)
+        seg_hours = sum(_hr for _hr, next_hr in zip(start2intvls, start2intvls[1:])
+                        if next_hr < _hr)
 
-        return str(round(sum(intvl_duration), 1))
+        return str(round(seg_hours + start2intvls[-1], 1))
 
     @classmethod
     def view(cls,
@@ -777,31 +985,16 @@ class Logs:
         """
         # Need to set messages and sizes specific to OS and files.
         text_height = 30
-        minsize_w = 0
-        minsize_h = 0
-        fnf_query = ''
-
-        # Need to set platform-specific window width so to not hide Buttons.
-        # Widths depend on each platform's TkFixedFont width in filetext.
         if filepath == cls.LOGFILE:
-            minsize_h = 220
-            if MY_OS == 'lin':
-                minsize_w = 800
-            if MY_OS == 'win':
-                minsize_w = 840
-            if MY_OS == 'dar':
-                minsize_w = 675
-            fnf_query = 'Was the log option ticked in settings?'
-
+            file_kind = 'log'
         elif filepath == cls.ANALYSISFILE:
-            minsize_w = 510
-            minsize_h = 150
-            if MY_OS == 'win':
-                minsize_w = 550
-            fnf_query = 'Have any analysis results been saved yet?'
-
-        if not Path.exists(filepath):
-            info = (f'On {gethostname()}, file is missing:\n{filepath}\n'
+            file_kind = 'analysis'
+        else:
+            file_kind = None
+        minsize_w, minsize_h, fnf_query = cls.VIEW_CFG.get(file_kind, (0, 0, ''))
+
+        if not filepath.exists():
+            info = (f'On {HOSTNAME}, file is missing:\n{filepath}\n'
                     f'{fnf_query}\n'
                     'Or, was file deleted, moved or renamed?')
             messagebox.showerror(title='FILE NOT FOUND', detail=info)
@@ -814,11 +1007,13 @@ class Logs:
                               highlightbackground='grey75'
                               )
         # Need title to include the file and local machine names.
-        filewin.title(f'{filepath.parts[-1]} on {gethostname()}')
+        filewin.title(f'{filepath.parts[-1]} on {HOSTNAME}')
         filewin.minsize(minsize_w, minsize_h)
         filewin.focus_set()
 
-        insert_txt = Path(filepath).read_text(encoding='utf-8')
+        # Import here, as only this file viewer uses ScrolledText, so that
+        #   log analysis alone need not load it.
+        from tkinter.scrolledtext import ScrolledText
 
         # Use a "dark" background/foreground theme for file text.
         filetext = ScrolledText(filewin, font='TkFixedFont',
@@ -828,10 +1023,14 @@ class Logs:
                                 relief='groove', bd=4,
                                 padx=12
                                 )
-        filetext.insert(tk.INSERT, insert_txt)
-        filetext.see(tk.END)
         filetext.pack(fill=tk.BOTH, side=tk.LEFT, expand=True)
 
+        # Files.update() loads the file in chunks, redrawing the window as
+        #   it goes, rather than inserting it as one string, and records
+        #   the read offset so that the Update button need only append
+        #   what has been logged since.
+        Files.update(filetext, filepath)
+
         ttk.Button(
             filewin, text='Update',
             command=lambda: Files.update(filetext, filepath, filewin),
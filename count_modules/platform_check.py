@@ -8,11 +8,11 @@ Functions: check_platform
 import sys
 import platform
 
-MY_OS = sys.platform[:3]
+from count_modules.config_constants import MY_OS
 
 
 def check_platform():
-    if MY_OS not in 'lin, win, dar':
+    if MY_OS not in ('lin', 'win', 'dar'):
         print(f'Platform <{sys.platform}> is not supported.\n'
               'Windows, Linux, and MacOS (darwin) are supported.')
         sys.exit(1)
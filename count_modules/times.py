@@ -12,6 +12,7 @@ Functions:
 
 import statistics
 from datetime import datetime, timedelta
+from operator import mul
 from typing import Union
 
 
@@ -160,11 +161,15 @@ def logtimes_stat(distribution: iter, stat: str, weights=None) -> str:
         time_parts = map(int, reversed(time_string.split(":")))
         return sum(unit * part for unit, part in zip(time_units, time_parts))
 
-    distrib_secs: Union[list[int], list] = [time_to_seconds(time) if isinstance(time, str)
+    # Logged task times repeat a lot, so convert each distinct time
+    #   string only once.
+    str_secs = {time: time_to_seconds(time) for time in set(distribution)
+                if isinstance(time, str)}
+    distrib_secs: Union[list[int], list] = [str_secs[time] if isinstance(time, str)
                                            else time for time in distribution]
 
     def weighted_mean():
-        numerator = sum(distrib_secs[i] * weights[i] for i in range(len(distrib_secs)))
+        numerator = sum(map(mul, distrib_secs, weights))
         denominator = sum(weights)
         return str(timedelta(seconds=numerator / denominator)).split(".", maxsplit=1)[0]
 
@@ -3,7 +3,6 @@
 General utility functions in gcount-tasks.
 Class: Tooltip - Bind mouse hover events to create a tooltip.
 Functions:
-    check_platform
     run_checks
     manage_args
     use_app_icon
@@ -30,7 +29,6 @@ Functions:
 # Standard library imports:
 import argparse
 import logging
-import platform
 import sys
 import tkinter as tk
 from datetime import datetime
@@ -38,12 +36,9 @@ from pathlib import Path
 from time import sleep
 from typing import Union
 
-if sys.platform[:3] == 'win':
+if sys.platform.startswith('win'):
     import winsound
 
-# Third party imports:
-import matplotlib.pyplot
-
 # Local program imports:
 import count_modules as cmod
 from count_modules import (boinc_commands,
@@ -52,29 +47,15 @@ from count_modules import (boinc_commands,
                            instances,
                            vcheck,
                            )
+from count_modules.platform_check import check_platform
 from count_modules.logs import Logs
 
 logger = logging.getLogger(__name__)
 handler = logging.StreamHandler(stream=sys.stdout)
 logger.addHandler(handler)
 
-MY_OS = sys.platform[:3]
-
-
-def check_platform():
-    if MY_OS not in 'lin, win, dar':
-        print(f'Platform <{sys.platform}> is not supported.\n'
-              'Windows, Linux, and MacOS (darwin) are supported.')
-        sys.exit(1)
+MY_OS = const.MY_OS
 
-    # Need to account for scaling in different Windows releases.
-    if MY_OS == 'win':
-        from ctypes import windll
-
-        if platform.release() < '10':
-            windll.user32.SetProcessDPIAware()
-        else:
-            windll.shcore.SetProcessDpiAwareness(1)
 
 def run_checks():
     """Program will exit if checks fail"""
@@ -407,7 +388,7 @@ class Tooltip:
         #   fully remove, not just deactivate, the title bar.
         #   https://stackoverflow.com/questions/63613253/
         #   how-to-disable-the-title-bar-in-tkinter-on-a-mac/
-        if sys.platform[:3] == 'dar':
+        if MY_OS == 'dar':
             self.tt_win.overrideredirect(False)
 
         self.tt_win.focus_force()
@@ -423,7 +404,7 @@ def beep(repeats: int) -> None:
 
     # Cannot repeat a sleep interval shorter than the sound play duration.
     for _ in range(repeats):
-        if 'win' in sys.platform:
+        if MY_OS == 'win':
             freq = 500
             dur = 200
             winsound.Beep(freq, dur)
@@ -498,14 +479,19 @@ def quit_gui(mainloop: tk.Tk, keybind=None) -> None:
     time_now = datetime.now().strftime(const.LONG_FMT)
     quit_txt = f'\n{time_now}; *** User quit the program. ***\n'
 
-    if Path.exists(Logs.LOGFILE):
+    if Logs.LOGFILE.exists():
         files.append_txt(dest=Logs.LOGFILE,
                          savetxt=quit_txt,
                          showmsg=False)
     try:
-        # Close all matplotlib figures to prevent memory leaks.
-        matplotlib.pyplot.close('all')
-        mainloop.update()
+        # Close all matplotlib figures to prevent memory leaks. Pyplot is
+        #   only imported (by logs.py) when matplotlib is installed, so no
+        #   need to import it here just to close it.
+        if 'matplotlib.pyplot' in sys.modules:
+            sys.modules['matplotlib.pyplot'].close('all')
+        # Only flush pending redraws; a full update() could re-enter
+        #   queued widget callbacks while the app is shutting down.
+        mainloop.update_idletasks()
         print(quit_txt)
         mainloop.after(200,mainloop.destroy)
         # Need explicit exit if for some reason a tk window isn't destroyed.
@@ -26,6 +26,7 @@ from typing import Union
 try:
     import tkinter as tk
     from tkinter import messagebox, ttk
+    from tkinter import font as tkfont
 except (ImportError, ModuleNotFoundError) as error:
     sys.exit('This program requires tkinter, which is included with \n'
              'Python 3.7+ distributions.\n'
@@ -862,9 +863,14 @@ class CountViewer(tk.Frame):
             master=self.dataframe,
             bg=const.DATA_BG)
 
+        # Use one named Font for all data labels instead of having Tk parse
+        #   the font tuple for each one. Keep a reference to it because the
+        #   named font is deleted when its Font object is garbage collected.
+        self.label_font = tkfont.Font(font=const.LABEL_FONT)
+
         boinc_lbl_params = dict(
             master=self.dataframe,
-            font=const.LABEL_FONT,
+            font=self.label_font,
             width=3,
             bg=const.DATA_BG)
 
@@ -921,6 +927,9 @@ class CountViewer(tk.Frame):
 
         # Text for compliment_l is configured in compliment_me()
         self.share.compliment_l = tk.Label(**master_highlight_params, )
+        # The after() ID of the pending compliment_l removal; used in
+        #   compliment_me().
+        self.share.compliment_after_id = None
         self.share.notice_l = tk.Label(**master_highlight_params,
                                        textvariable=self.share.notice['notice_txt'],
                                        relief='flat', border=0)
@@ -1032,22 +1041,28 @@ class CountViewer(tk.Frame):
         # Need to provide exit info to Terminal and log.
         self.master.protocol('WM_DELETE_WINDOW', lambda: utils.quit_gui(mainloop=app))
 
-        self.master.columnconfigure(1, weight=1)
-        self.master.columnconfigure(2, weight=1)
+        # Tk grid accepts a list of indices, so configure both data
+        #   columns with one call.
+        self.master.columnconfigure((1, 2), weight=1)
 
         self.dataframe.configure(borderwidth=3, relief='sunken',
                                  bg=const.DATA_BG)
-        self.dataframe.columnconfigure(1, weight=1)
-        self.dataframe.columnconfigure(2, weight=1)
+        self.dataframe.columnconfigure((1, 2), weight=1)
 
         # Need to grey-out menu bar headings and View log button when
         #   another application has focus.
         #   source: https://stackoverflow.com/questions/18089068/
         #   tk-tkinter-detect-application-lost-focus
-        self.bind_all('<FocusIn>', self.app_got_focus)
-        self.bind_all('<FocusOut>', self.app_lost_focus)
+        # Application-wide events are collected here and bound in one pass
+        #   with bind_all(), below, once the Linux select keys are added.
+        all_bindings = {
+            '<FocusIn>': self.app_got_focus,
+            '<FocusOut>': self.app_lost_focus,
+        }
 
-        # Bind key events to corresponding functions
+        # Bind key events to corresponding functions. These stay bound only
+        #   to the main window so that, e.g., Esc in a Toplevel closes just
+        #   that window and does not quit the app.
         key_bindings = {
             '<Escape>': lambda _: utils.quit_gui(mainloop=app),
             '<Control-q>': lambda _: utils.quit_gui(mainloop=app),
@@ -1065,15 +1080,18 @@ class CountViewer(tk.Frame):
         #   bound to the tkinter predefined virtual event <<LineStart>>,
         #   not <<SelectAll>>, for some reason? And  Shift-Control-A
         #   will select text from cursor to <<LineStart>>.
-        if const.MY_OS in 'lin':
+        if const.MY_OS == 'lin':
             def select_all(event=None):
                 app.focus_get().event_generate('<<SelectAll>>')
 
             def select_none(event=None):
                 app.focus_get().event_generate('<<SelectNone>>')
 
-            self.master.bind_all('<Control-a>', select_all)
-            self.master.bind_all('<Shift-Control-A>', select_none)
+            all_bindings['<Control-a>'] = select_all
+            all_bindings['<Shift-Control-A>'] = select_none
+
+        for event, func in all_bindings.items():
+            self.bind_all(event, func)
 
         # For colored separators, use ttk.Frame instead of ttk.Separator.
         # Initialize then configure style for separator color.
@@ -1191,7 +1209,7 @@ class CountViewer(tk.Frame):
             row=12, column=1, padx=3, sticky=tk.W)
 
         # Place cycles_remain value in same cell as its header, but shifted right.
-        if const.MY_OS in 'lin, dar':
+        if const.MY_OS in ('lin', 'dar'):
             self.cycles_remain_l.grid(
                 row=12, column=2, padx=(123, 0), sticky=tk.W)
         else:  # is 'win':
@@ -1221,7 +1239,7 @@ class CountViewer(tk.Frame):
 
         # Need to make settings window topmost to place it above the
         #   app window.
-        if const.MY_OS in 'lin, win':
+        if const.MY_OS in ('lin', 'win'):
             self.settings_win.attributes('-topmost', True)
         # In macOS, topmost places Combobox selections BEHIND the window,
         #    but focus_force() makes it visible; must be a tkinter bug?
@@ -1483,9 +1501,6 @@ class CountViewer(tk.Frame):
                                 level=logging.INFO,
                                 filemode="a",
                                 format='%(message)s')
-        else:
-            app.title(f'Count BOINC tasks on {gethostname()}'
-                      ' (not logging data)')
 
         # Need to provide a unique name of app window for concurrent instances
         #  on different hosts.
@@ -1705,12 +1720,13 @@ class CountFyi:
 
         insert_txt = utils.about_text()
 
-        max_line = len(max(insert_txt.splitlines(), key=len))
+        lines = insert_txt.split('\n')
+        max_line = max(map(len, lines))
 
         abouttxt = tk.Text(aboutwin,
                            font='TkFixedFont',
                            width=max_line,
-                           height=insert_txt.count('\n') + 2,
+                           height=len(lines) + 1,
                            relief='groove',
                            borderwidth=5,
                            padx=25)
@@ -1773,6 +1789,11 @@ class CountFyi:
             'You always know how to put together the perfect outfit.',
             "I can't think of anything to say. Sorry.",
         ]
+        # Need to cancel the pending removal from a prior call so that
+        #   repeated clicks reuse the one label and its one after() callback.
+        if self.share.compliment_after_id:
+            self.share.compliment_l.after_cancel(self.share.compliment_after_id)
+
         self.share.compliment_l.config(text=choice(compliments))
         self.share.notice_l.grid_remove()
         # Need to re-grid initial master_menus_and_buttons() grids b/c its grid may
@@ -1781,12 +1802,13 @@ class CountFyi:
         self.share.compliment_l.grid()
 
         def refresh():
+            self.share.compliment_after_id = None
             self.share.compliment_l.grid_remove()
             # Re-grid notice to return to current Notice text.
             self.share.notice_l.grid()
             app.update_idletasks()
 
-        self.share.compliment_l.after(4444, refresh)
+        self.share.compliment_after_id = self.share.compliment_l.after(4444, refresh)
 
     @staticmethod
     def file_paths(window: tk.Toplevel) -> None:
@@ -1814,13 +1836,13 @@ class CountFyi:
 
         insert_txt = (
             'Included with GitHub project distribution:\n\n'
-            f'Example log file: (file exists: {Path.exists(Logs.EXAMPLELOG)})\n'
+            f'Example log file: (file exists: {Logs.EXAMPLELOG.exists()})\n'
             f'   {Logs.EXAMPLELOG}\n\n'
             f'Created by {PROGRAM_NAME}:\n\n'
-            f'Data log (file exists: {Path.exists(Logs.LOGFILE)})\n'
+            f'Data log (file exists: {Logs.LOGFILE.exists()})\n'
             '   ...do not alter this file while program is running\n'
             f'   {Logs.LOGFILE}\n\n'
-            f'Saved log analyses (file exists: {Path.exists(Logs.ANALYSISFILE)})\n'
+            f'Saved log analyses (file exists: {Logs.ANALYSISFILE.exists()})\n'
             f'   {Logs.ANALYSISFILE}\n'
         )
 
@@ -1833,10 +1855,11 @@ class CountFyi:
             insert_txt = (f'{insert_txt}\nLockfile (hidden):\n'
                           f'   {lockfile_fullpath}\n')
 
-        max_line = len(max(insert_txt.splitlines(), key=len))
+        lines = insert_txt.split('\n')
+        max_line = max(map(len, lines))
 
         pathstxt = tk.Text(pathswin, font='TkFixedFont',
-                           height=insert_txt.count('\n') + 1,
+                           height=len(lines),
                            width=max_line,
                            relief='groove', borderwidth=5,
                            padx=10, pady=10)
@@ -1846,6 +1869,9 @@ class CountFyi:
         # pathstxt.tag_configure("header", justify='center')
         # pathstxt.tag_add("header", "1.0", "1.0")
         pathstxt.pack()
+        # Need to not have cursor appear in Text, but allow
+        #   rt-click edit commands to work if needed.
+        pathstxt.configure(state=tk.DISABLED)
 
         bind_this.keybind(func='close', toplevel=pathswin)
         bind_this.click(click_type='right', click_widget=pathstxt)
@@ -1895,7 +1921,7 @@ class CountFyi:
 
         # OS-specific Text widths were empirically determined for TkTextFont.
         os_width = 0
-        if const.MY_OS in 'lin, win':
+        if const.MY_OS in ('lin', 'win'):
             os_width = 64
         else:  # is 'dar'
             os_width = 56
@@ -0,0 +1,68 @@
+"""
+Tests for log file analysis in count_modules.logs.
+"""
+# Copyright (C) 2021 C. Echt under GNU General Public License'
+
+from count_modules import utils  # Import first to resolve the utils-logs import cycle.
+from count_modules.logs import Logs
+
+INTERVAL = """
+{date}; Tasks reported in the past 1h: {count}
+                      Task Time: avg {avg},
+                                 range [{mint} -- {maxt}],
+                                 stdev 00:00:08, total 06:05:54
+                      Total tasks in queue: 53
+                      827 counts remain.
+"""
+
+SUMMARY = """
+{date}; >>> SUMMARY: Task count for the past 1d: {count}
+                      Task Time: mean 0:21:28,
+                                 range [00:16:03 -- 00:22:33],
+                                 stdev 00:00:42, total 5d 23:54:05
+"""
+
+
+def long_task_log() -> str:
+    """
+    A log of intervals, before and after a summary, where one interval
+    in each part has a longest task time of more than 24 hours.
+    """
+    text = ('2022-Apr-09 22:12:11; '
+            'Number of tasks in the most recent BOINC report: 18\n')
+    intervals = (
+        ('2022-Apr-09 23:12:11', 17, '00:21:31', '00:21:19', '00:21:51'),
+        ('2022-Apr-10 00:12:11', 2, '00:10:31', '00:10:00', '1d 00:31:00'),
+        ('2022-Apr-10 01:12:11', 17, '00:21:14', '00:18:05', '00:22:03'),
+    )
+    for date, count, avg, mint, maxt in intervals:
+        text += INTERVAL.format(date=date, count=count, avg=avg,
+                                mint=mint, maxt=maxt)
+    text += SUMMARY.format(date='2022-Apr-10 01:12:11', count=36)
+    recent = (
+        ('2022-Apr-10 02:12:11', 16, '00:22:10', '00:21:40', '00:22:50'),
+        ('2022-Apr-10 03:12:11', 3, '00:20:00', '00:19:00', '1d 02:00:00'),
+    )
+    for date, count, avg, mint, maxt in recent:
+        text += INTERVAL.format(date=date, count=count, avg=avg,
+                                mint=mint, maxt=maxt)
+    return text
+
+
+def test_analysis_with_task_time_over_one_day(tmp_path, monkeypatch):
+    logfile = tmp_path / 'test_log.txt'
+    logfile.write_text(long_task_log(), encoding='utf-8')
+    monkeypatch.setattr(Logs, 'LOGFILE', logfile)
+    monkeypatch.setattr(Logs, 'LOG_CACHE', ())
+    monkeypatch.setattr(Logs, 'REPORT_CACHE', ())
+
+    _, _, found_intvl_avgt, found_intvl_t_range, _ = Logs.parse_logfile(logfile)
+    assert len(found_intvl_avgt) == 5
+    assert len(found_intvl_t_range) == 3
+
+    summary_text, recent_interval_text = Logs.analyze_logfile()
+    assert 'cannot determine' not in summary_text
+    assert 'cannot determine' not in recent_interval_text
+    assert 'weighted mean task time' in summary_text
+    assert 'std deviation task time' in summary_text
+    assert 'weighted mean task time' in recent_interval_text